@@ -0,0 +1,40 @@
+"""
+Compiled kernels for hot preprocessing loops.
+
+The kernels are only defined when numba is installed; callers must check
+NUMBA_AVAILABLE before using them.
+"""
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.debug("numba not available. Compiled preprocessing kernels disabled.")
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True)
+    def ffill_2d(a: np.ndarray) -> None:
+        """
+        Forward fill NaNs down each column of a 2D float array, in place.
+
+        Columns are filled in parallel. Pass a row-reversed view
+        (``a[::-1]``) to backward fill instead.
+
+        Args:
+            a: 2D float array of shape (rows, columns).
+        """
+        n, m = a.shape
+        for j in prange(m):
+            last = np.nan
+            for i in range(n):
+                v = a[i, j]
+                last = last if np.isnan(v) else v
+                a[i, j] = last
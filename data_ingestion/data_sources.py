@@ -1,11 +1,35 @@
+import logging
 from abc import ABC, abstractmethod # as needed
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import connectorx as cx
+    CONNECTORX_AVAILABLE = True
+except ImportError:
+    logger.debug("connectorx not available. Falling back to pandas.read_sql.")
+    CONNECTORX_AVAILABLE = False
 
 class DataSource(ABC):
     """Abstract base class for data sources."""
 
     @abstractmethod
-    def extract_data(self) -> pd.DataFrame:
-        """Extracts data from the source."""
+    def extract_data(self, query: str) -> Any:
+        """
+        Extracts data from the source.
+
+        Subclasses may add optional, source-specific keyword arguments.
+
+        Args:
+            query: Source-specific description of the data to extract
+                   (e.g. a SQL query).
+
+        Returns:
+            The extracted data, usually a pandas DataFrame.
+        """
         pass
 
 class DatabaseSource(DataSource):
@@ -14,9 +38,54 @@ class DatabaseSource(DataSource):
     def __init__(self, db_connection_string):
         self.connection_string = db_connection_string
 
-    def extract_data(self) -> pd.DataFrame:
-        # Implement logic to connect to the database and extract data
-        # ...
-        return data
+    def extract_data(
+        self,
+        query: str,
+        partition_on: Optional[str] = None,
+        partition_num: Optional[int] = None,
+        return_type: str = "pandas",
+        batch_size: Optional[int] = None
+    ) -> Any:
+        """
+        Runs a query against the database and returns the result.
+
+        Uses connectorx when installed, which reads rows straight into
+        pandas/Arrow buffers and can split the query across parallel readers.
+        Otherwise falls back to pandas.read_sql.
+
+        Args:
+            query: SQL query to execute.
+            partition_on: Optional numeric column to partition the query on.
+            partition_num: Number of parallel partitions. Required when
+                           partition_on is set.
+            return_type: 'pandas', 'arrow' or 'arrow_stream' (connectorx only).
+            batch_size: Record batch size when return_type is 'arrow_stream'.
+
+        Returns:
+            A pandas DataFrame, or an Arrow table/record batch reader when an
+            Arrow return_type is requested.
+
+        Raises:
+            ValueError: If an Arrow return_type is requested without connectorx,
+                        or only one of partition_on and partition_num is set.
+        """
+        if (partition_on is None) != (partition_num is None):
+            raise ValueError("partition_on and partition_num must be set together")
+
+        if not CONNECTORX_AVAILABLE:
+            if return_type != "pandas":
+                raise ValueError(
+                    f"return_type '{return_type}' requires the connectorx package"
+                )
+            return pd.read_sql(query, self.connection_string)
+
+        kwargs: Dict[str, Any] = {"return_type": return_type}
+        if partition_on is not None:
+            kwargs["partition_on"] = partition_on
+            kwargs["partition_num"] = partition_num
+        if return_type == "arrow_stream" and batch_size is not None:
+            kwargs["batch_size"] = batch_size
+
+        return cx.read_sql(self.connection_string, query, **kwargs)
 
 # Other data source classes (e.g., API Source, File Source) can be defined similarly
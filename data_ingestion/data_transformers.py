@@ -5,20 +5,268 @@ This module provides functions for cleaning, transforming, and preprocessing
 data to prepare it for analysis or machine learning.
 """
 
+import hashlib
 import logging
-from typing import Optional, List, Dict, Any
+import re
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Hashable, Tuple
 import pandas as pd
 import numpy as np
 
+from data_ingestion._kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from data_ingestion._kernels import ffill_2d
+
 logger = logging.getLogger(__name__)
 
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    logger.debug("bottleneck not available. Falling back to pandas for ffill/bfill.")
+    BOTTLENECK_AVAILABLE = False
+
+# Frames with fewer rows than this are filled with bottleneck/pandas even
+# when numba is installed: loading (or compiling) the kernel costs more
+# than it saves on small inputs
+NUMBA_FILL_ROW_THRESHOLD = 1_000_000
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    logger.debug("pyarrow not available. Object columns stay NumPy-backed.")
+    PYARROW_AVAILABLE = False
+
+# Frames with fewer rows than this impute float blocks with one np.copyto;
+# taller frames use fillna, which is cheaper once the rows dominate
+IMPUTE_BLOCK_ROW_THRESHOLD = 50_000
+
+# Maximum number of results kept by preprocess_data(enable_cache=True)
+PREPROCESS_CACHE_SIZE = 32
+_preprocess_cache: "OrderedDict[Tuple[Hashable, ...], pd.DataFrame]" = OrderedDict()
+
+# format='ISO8601' selects pandas' C ISO parser (pandas >= 2.0)
+_ISO8601_FORMAT_SUPPORTED = int(pd.__version__.split('.')[0]) >= 2
+_ISO8601_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?(Z|[+-]\d{2}:?\d{2})?$')
+
+# Text columns with fewer unique values than this fraction of rows are
+# converted to categoricals when downcasting
+CATEGORICAL_CARDINALITY_RATIO = 0.5
+
+
+def clear_preprocess_cache() -> None:
+    """Drop all results cached by preprocess_data(enable_cache=True)."""
+    _preprocess_cache.clear()
+
+
+def _cache_key(df: pd.DataFrame, options: Tuple[Hashable, ...]) -> Optional[Tuple[Hashable, ...]]:
+    """
+    Build a content-based cache key for a DataFrame and preprocessing options.
+
+    Row values and the index are hashed with ``hash_pandas_object`` and the
+    result is condensed to a short digest, so equal frames map to the same
+    key regardless of object identity.
+
+    Returns:
+        The cache key, or None if the frame holds unhashable values.
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    schema = tuple(zip(df.columns, map(str, df.dtypes)))
+    return (digest, schema) + options
+
+
+def _float_blocks(df: pd.DataFrame) -> List[pd.Index]:
+    """
+    Group the NumPy float columns of a DataFrame by dtype.
+
+    Each group can be pulled out as one homogeneous 2D array, operated on
+    with a single vectorized call and assigned back without changing dtype.
+    Nullable extension dtypes (e.g. ``Float64``) are not included.
+
+    Args:
+        df: DataFrame to inspect.
+
+    Returns:
+        List of column indexes, one per float dtype present.
+    """
+    blocks = []
+    for dtype in (np.float64, np.float32):
+        cols = df.columns[(df.dtypes == dtype).to_numpy()]
+        if len(cols):
+            blocks.append(cols)
+    return blocks
+
+
+def _fill_directional(df: pd.DataFrame, method: str) -> pd.DataFrame:
+    """
+    Forward or backward fill missing values.
+
+    Float columns are filled by a compiled kernel when one is available:
+    the numba ``ffill_2d`` kernel over each float block for frames of at
+    least NUMBA_FILL_ROW_THRESHOLD rows, otherwise ``bottleneck.push``
+    column by column. All other columns (and every column when neither
+    kernel applies) go through pandas.
+
+    Args:
+        df: DataFrame to fill. Modified in place where possible.
+        method: Either 'ffill' or 'bfill'.
+
+    Returns:
+        DataFrame with missing values filled.
+    """
+    use_numba = NUMBA_AVAILABLE and len(df) >= NUMBA_FILL_ROW_THRESHOLD
+    if not (use_numba or BOTTLENECK_AVAILABLE):
+        return df.ffill() if method == 'ffill' else df.bfill()
+
+    # Only NumPy float blocks go through the kernels; nullable Float64 and
+    # every other column are left for pandas below
+    blocks = _float_blocks(df)
+    float_cols = pd.Index([col for cols in blocks for col in cols])
+    if use_numba:
+        for cols in blocks:
+            block = df[cols].to_numpy(copy=True)
+            ffill_2d(block if method == 'ffill' else block[::-1])
+            df[cols] = block
+    else:
+        for col in float_cols:
+            arr = df[col].to_numpy()
+            if method == 'ffill':
+                df[col] = bn.push(arr, axis=0)
+            else:
+                df[col] = bn.push(arr[::-1], axis=0)[::-1]
+
+    other_cols = df.columns.difference(float_cols, sort=False)
+    if len(other_cols):
+        filled = df[other_cols].ffill() if method == 'ffill' else df[other_cols].bfill()
+        df[other_cols] = filled
+    return df
+
+
+def _impute_numeric(df: pd.DataFrame, strategy: str) -> pd.DataFrame:
+    """
+    Replace missing numeric values with the column mean or median.
+
+    The per-column fill values come from pandas' column reductions over each
+    float block. Frames below IMPUTE_BLOCK_ROW_THRESHOLD rows then write them
+    into the NaN positions of one copied 2D block with ``np.copyto`` (a
+    broadcasting ``np.putmask``) and assign the block back in one go, which
+    avoids pandas' per-column overhead on wide frames. Taller frames use
+    ``fillna``, which is cheaper there than the extra mask pass.
+
+    Args:
+        df: DataFrame to impute. Modified in place.
+        strategy: Either 'mean' or 'median'.
+
+    Returns:
+        DataFrame with numeric missing values imputed.
+    """
+    for cols in _float_blocks(df):
+        sub = df[cols]
+        # All-NaN columns reduce to NaN and are left untouched
+        fill_values = sub.mean() if strategy == 'mean' else sub.median()
+        if len(df) >= IMPUTE_BLOCK_ROW_THRESHOLD:
+            df[cols] = sub.fillna(fill_values)
+            continue
+        block = sub.to_numpy(copy=True)
+        np.copyto(block, fill_values.to_numpy()[np.newaxis, :], where=np.isnan(block))
+        df[cols] = block
+
+    # Nullable extension types are left to pandas
+    for col in df.select_dtypes(include=[np.number]).columns:
+        if not isinstance(df[col].dtype, np.dtype):
+            fill_value = df[col].mean() if strategy == 'mean' else df[col].median()
+            df[col] = df[col].fillna(fill_value)
+    return df
+
+
+def _infer_date_format(series: pd.Series) -> Optional[str]:
+    """
+    Pick a datetime format hint for a column when none was given.
+
+    Returns 'ISO8601' when the first non-null value is an ISO-8601 string and
+    the installed pandas supports that format, otherwise None.
+    """
+    if not _ISO8601_FORMAT_SUPPORTED:
+        return None
+    first_valid = series.first_valid_index()
+    if first_valid is None:
+        return None
+    value = series.loc[first_valid]
+    if isinstance(value, str) and _ISO8601_PATTERN.match(value):
+        return 'ISO8601'
+    return None
+
+
+def _to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert pure-string object columns to PyArrow-backed string dtype.
+
+    Arrow-backed columns are filled with a ``take`` instead of the slow
+    object putmask path. Columns holding anything other than strings (and
+    missing values) are left alone so no values are stringified.
+
+    Args:
+        df: DataFrame to convert. Modified in place.
+
+    Returns:
+        DataFrame with string columns backed by PyArrow.
+    """
+    for col in df.select_dtypes(include=['object']).columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+            df[col] = df[col].astype('string[pyarrow]')
+    return df
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink column dtypes to the narrowest type that holds the data.
+
+    Integer and float columns are downcast with ``pd.to_numeric`` (floats may
+    lose precision beyond float32), and low-cardinality text columns become
+    categoricals. Narrower dtypes cut the memory traffic of every later step.
+
+    Args:
+        df: DataFrame to downcast. Modified in place.
+
+    Returns:
+        DataFrame with downcast dtypes.
+    """
+    downcast_kinds = {'i': 'integer', 'u': 'unsigned', 'f': 'float'}
+    for col in df.columns:
+        dtype = df[col].dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in downcast_kinds:
+            df[col] = pd.to_numeric(df[col], downcast=downcast_kinds[dtype.kind])
+
+    n_rows = len(df)
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        try:
+            n_unique = df[col].nunique()
+        except TypeError:
+            continue  # Unhashable values such as lists
+        if n_unique < CATEGORICAL_CARDINALITY_RATIO * n_rows:
+            df[col] = df[col].astype('category')
+    return df
+
 
 def preprocess_data(
     df: pd.DataFrame,
     handle_missing: str = 'ffill',
     date_columns: Optional[List[str]] = None,
     numeric_columns: Optional[List[str]] = None,
-    drop_duplicates: bool = True
+    drop_duplicates: bool = True,
+    date_format: Optional[str] = None,
+    cache_dates: bool = True,
+    categorical_columns: Optional[List[str]] = None,
+    inplace: bool = False,
+    downcast: bool = False,
+    use_pyarrow: bool = False,
+    enable_cache: bool = False
 ) -> pd.DataFrame:
     """
     Preprocess DataFrame by handling missing values and performing transformations.
@@ -38,6 +286,26 @@ def preprocess_data(
         date_columns: Optional list of column names to convert to datetime.
         numeric_columns: Optional list of column names to ensure are numeric.
         drop_duplicates: If True, removes duplicate rows.
+        date_format: Optional strftime format of the date columns. Lets pandas
+                    use its fast fixed-format parser instead of inferring the
+                    format per element. If None, ISO-8601 strings are detected
+                    automatically.
+        cache_dates: If True, caches parsed unique date strings during
+                    conversion.
+        categorical_columns: Optional list of column names to store as
+                            categorical (e.g. protected attributes), so
+                            downstream bias checks can reuse the codes.
+        inplace: If True, skips the defensive copy and may modify the input
+                DataFrame. Always use the returned DataFrame, since row-removing
+                steps (dropna, duplicate removal) still return a new object.
+        downcast: If True, downcasts numeric columns to the narrowest dtype
+                 that holds their values and converts low-cardinality text
+                 columns to categoricals.
+        use_pyarrow: If True and pyarrow is installed, stores pure-string
+                    object columns as PyArrow-backed strings before filling.
+        enable_cache: If True, returns a cached result when a DataFrame with
+                     identical contents was already preprocessed with the same
+                     options. Use clear_preprocess_cache() to reset it.
 
     Returns:
         Preprocessed DataFrame.
@@ -58,19 +326,37 @@ def preprocess_data(
         logger.warning("Empty DataFrame provided")
         return df
 
-    df = df.copy()  # Avoid modifying original DataFrame
+    cache_key = None
+    if enable_cache:
+        cache_key = _cache_key(df, (
+            handle_missing,
+            tuple(date_columns or ()),
+            tuple(numeric_columns or ()),
+            drop_duplicates,
+            date_format,
+            cache_dates,
+            tuple(categorical_columns or ()),
+            downcast,
+            use_pyarrow
+        ))
+        if cache_key is not None and cache_key in _preprocess_cache:
+            _preprocess_cache.move_to_end(cache_key)
+            logger.info("Returning cached preprocessing result")
+            return _preprocess_cache[cache_key].copy()
+
+    if not inplace:
+        # Shallow copy: columns are replaced rather than written into, so
+        # the caller's data is never touched and no data is duplicated
+        df = df.copy(deep=False)
+
+    if use_pyarrow and PYARROW_AVAILABLE:
+        df = _to_arrow_strings(df)
 
     # Handle missing values
-    if handle_missing == 'ffill':
-        df = df.ffill()
-    elif handle_missing == 'bfill':
-        df = df.bfill()
-    elif handle_missing == 'mean':
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].mean())
-    elif handle_missing == 'median':
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())
+    if handle_missing in ('ffill', 'bfill'):
+        df = _fill_directional(df, handle_missing)
+    elif handle_missing in ('mean', 'median'):
+        df = _impute_numeric(df, handle_missing)
     elif handle_missing == 'drop':
         df = df.dropna()
     else:
@@ -84,16 +370,33 @@ def preprocess_data(
         for col in date_columns:
             if col in df.columns:
                 try:
-                    df[col] = pd.to_datetime(df[col], errors='coerce')
+                    col_format = date_format or _infer_date_format(df[col])
+                    df[col] = pd.to_datetime(
+                        df[col], format=col_format, errors='coerce', cache=cache_dates
+                    )
                     logger.info(f"Converted column '{col}' to datetime")
                 except Exception as e:
                     logger.warning(f"Failed to convert '{col}' to datetime: {e}")
 
     # Ensure numeric columns are numeric
     if numeric_columns:
-        for col in numeric_columns:
+        # Columns that are already numeric need no conversion; convert the
+        # rest in one apply and a single block assignment
+        to_convert = [
+            col for col in dict.fromkeys(numeric_columns)
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
+        ]
+        if to_convert:
+            df[to_convert] = df[to_convert].apply(pd.to_numeric, errors='coerce')
+
+    if downcast:
+        df = _downcast(df)
+
+    # Store low-cardinality grouping columns as categoricals
+    if categorical_columns:
+        for col in categorical_columns:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+                df[col] = df[col].astype('category')
 
     # Remove duplicates
     if drop_duplicates:
@@ -103,5 +406,10 @@ def preprocess_data(
         if removed > 0:
             logger.info(f"Removed {removed} duplicate rows")
 
+    if cache_key is not None:
+        _preprocess_cache[cache_key] = df.copy()
+        if len(_preprocess_cache) > PREPROCESS_CACHE_SIZE:
+            _preprocess_cache.popitem(last=False)
+
     logger.info(f"Preprocessing complete. Final shape: {df.shape}")
     return df
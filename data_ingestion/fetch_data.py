@@ -4,10 +4,50 @@ This module provides functions for fetching data from various sources.
 
 import requests
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    logger.debug("orjson not available. Falling back to the standard json parser.")
+    ORJSON_AVAILABLE = False
+
+# Shared session so repeated calls reuse pooled TCP/TLS connections
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        read=False,  # Re-raise read timeouts so callers still see Timeout
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False  # Let raise_for_status() report the final error
+    )
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+def _parse_json(response: requests.Response) -> Optional[dict]:
+    """
+    Decodes a JSON response body, using orjson when available.
+
+    orjson parses the raw bytes directly without a separate UTF-8 decode.
+    Decode errors are raised as requests' JSONDecodeError either way.
+    """
+    if not ORJSON_AVAILABLE:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
 def fetch_data_from_api(url: str, api_key: str, timeout: int = 30) -> Optional[dict]:
     """
     Fetches data from a REST API.
@@ -24,9 +64,9 @@ def fetch_data_from_api(url: str, api_key: str, timeout: int = 30) -> Optional[d
     """
     headers = {"Authorization": f"Bearer {api_key}"}
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = _session.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()  # Raise an exception for bad status codes
-        return response.json()
+        return _parse_json(response)
     except requests.exceptions.Timeout:
         logger.error(f"Request timeout for URL: {url}")
         raise
@@ -36,3 +76,37 @@ def fetch_data_from_api(url: str, api_key: str, timeout: int = 30) -> Optional[d
     except requests.exceptions.RequestException as e:
         logger.error(f"Error fetching data from API: {e}")
         raise
+
+def fetch_data_batch(
+    urls: List[str],
+    api_key: str,
+    timeout: int = 30,
+    max_workers: int = 16
+) -> List[Optional[dict]]:
+    """
+    Fetches data from several REST API endpoints concurrently.
+
+    Requests are issued from a thread pool over the shared connection pool;
+    the GIL is released while each thread waits on its socket.
+
+    Args:
+        urls: The URLs of the API endpoints.
+        api_key: The API key for authentication.
+        timeout: Per-request timeout in seconds.
+        max_workers: Maximum number of concurrent requests.
+
+    Returns:
+        A list of fetched data dictionaries, in the same order as urls.
+
+    Raises:
+        requests.exceptions.RequestException: If any of the API requests fails.
+    """
+    if not urls:
+        return []
+
+    workers = min(max_workers, len(urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            lambda url: fetch_data_from_api(url, api_key, timeout=timeout),
+            urls
+        ))
@@ -61,28 +61,43 @@ def validate_data(
 
     # Check required columns
     if required_columns:
-        missing_cols = set(required_columns) - set(df.columns)
-        if missing_cols:
+        missing_cols = pd.Index(required_columns).difference(df.columns)
+        if len(missing_cols):
             raise ValueError(
                 f"Missing required columns: {', '.join(missing_cols)}"
             )
 
     # Data type checks
     if strict_types:
-        for column in df.columns:
-            inferred_type = df[column].infer_objects().dtype
-            if df[column].dtype != inferred_type:
+        # Infer all column types in one pass and compare the dtype vectors
+        orig_dtypes = df.dtypes.to_numpy()
+        inferred_dtypes = df.infer_objects().dtypes.to_numpy()
+        mismatch_mask = orig_dtypes != inferred_dtypes
+        if mismatch_mask.any():
+            for column, got, expected in zip(
+                df.columns[mismatch_mask],
+                orig_dtypes[mismatch_mask],
+                inferred_dtypes[mismatch_mask]
+            ):
                 logger.warning(
                     f"Type mismatch for column '{column}': "
-                    f"expected {inferred_type}, got {df[column].dtype}"
+                    f"expected {expected}, got {got}"
                 )
-                if strict_types:
-                    raise ValueError(
-                        f"Data type mismatch for column: {column}"
-                    )
+            raise ValueError(
+                f"Data type mismatch for columns: {df.columns[mismatch_mask].tolist()}"
+            )
 
-    # Missing value checks
-    missing_count = df.isnull().sum().sum()
+    # Missing value checks. NumPy float columns are counted with a single
+    # np.isnan pass and NumPy int/bool columns cannot hold missing values,
+    # so only the remaining columns need a pandas isna() mask.
+    kinds = np.array([t.kind if isinstance(t, np.dtype) else '' for t in df.dtypes])
+    float_mask = kinds == 'f'
+    other_mask = ~(float_mask | np.isin(kinds, ['b', 'i', 'u']))
+    missing_count = 0
+    if float_mask.any():
+        missing_count += int(np.isnan(df.loc[:, float_mask].to_numpy()).sum())
+    if other_mask.any():
+        missing_count += int(df.loc[:, other_mask].isna().to_numpy().sum())
     if missing_count > 0:
         if not allow_missing:
             raise ValueError(
@@ -91,10 +106,27 @@ def validate_data(
             )
         logger.warning(f"Found {missing_count} missing values in data")
 
-    # Check for infinite values
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        if np.isinf(df[col]).any():
+    # Check for infinite values. Each NumPy float dtype block is scanned
+    # with one np.isinf pass and cleaned in place with np.putmask.
+    for dtype in (np.float64, np.float32):
+        cols = df.columns[(df.dtypes == dtype).to_numpy()]
+        if not len(cols):
+            continue
+        block = df[cols].to_numpy()
+        inf_mask = np.isinf(block)
+        if inf_mask.any():
+            for col in cols[inf_mask.any(axis=0)]:
+                logger.warning(f"Infinite values found in column: {col}")
+            block = block.copy()
+            np.putmask(block, inf_mask, np.nan)
+            df[cols] = block
+
+    # Nullable float extension columns go through pandas
+    for col in df.select_dtypes(include=[np.floating]).columns:
+        if isinstance(df[col].dtype, np.dtype):
+            continue
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isinf(values).any():
             logger.warning(f"Infinite values found in column: {col}")
             df[col] = df[col].replace([np.inf, -np.inf], np.nan)
 
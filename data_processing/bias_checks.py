@@ -21,6 +21,90 @@ except ImportError:
     logger.warning("AIF360 library not available. Bias checking will be limited.")
     AIF360_AVAILABLE = False
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# Frames with more rows than this compute group rates with Polars when it
+# is installed
+POLARS_ROW_THRESHOLD = 1_000_000
+
+
+def _group_rates_polars(
+    df: pd.DataFrame,
+    protected_attribute: str,
+    target_column: str,
+    group_values: List[Any]
+) -> List[float]:
+    """
+    Polars implementation of ``_group_rates`` for large frames.
+
+    Only the two relevant columns are handed to Polars, whose multi-threaded
+    group_by computes every group mean in one pass.
+    """
+    pl_df = pl.from_pandas(df[[protected_attribute, target_column]], rechunk=False)
+    agg = pl_df.group_by(protected_attribute).agg(
+        pl.col(target_column).cast(pl.Float64).mean()
+    )
+    rates = dict(zip(agg[protected_attribute].to_list(), agg[target_column].to_list()))
+    return [
+        np.nan if rates.get(value) is None else rates[value]
+        for value in group_values
+    ]
+
+
+def _group_rates(
+    df: pd.DataFrame,
+    protected_attribute: str,
+    target_column: str,
+    group_values: List[Any]
+) -> List[float]:
+    """
+    Compute the mean target value for each requested protected group.
+
+    The protected attribute is factorized once (categorical columns reuse
+    their stored codes) and all group means are obtained from a single pair
+    of ``np.bincount`` passes, without building a masked copy of the
+    DataFrame per group. Frames above POLARS_ROW_THRESHOLD rows are handed
+    to Polars instead when it is installed.
+
+    Args:
+        df: DataFrame to analyze.
+        protected_attribute: Name of the protected attribute column.
+        target_column: Name of the target/outcome column.
+        group_values: Protected attribute values to compute rates for.
+
+    Returns:
+        List of mean target values in the same order as group_values.
+        NaN for groups with no (non-missing) observations.
+    """
+    if POLARS_AVAILABLE and len(df) > POLARS_ROW_THRESHOLD:
+        return _group_rates_polars(df, protected_attribute, target_column, group_values)
+
+    groups = df[protected_attribute]
+    if isinstance(groups.dtype, pd.CategoricalDtype):
+        codes = groups.cat.codes.to_numpy()
+        uniques = groups.cat.categories
+    else:
+        codes, uniques = pd.factorize(groups)
+    y = df[target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Skip missing group labels (code -1) and missing targets, like mean()
+    valid = (codes >= 0) & ~np.isnan(y)
+    sums = np.bincount(codes[valid], weights=y[valid], minlength=len(uniques))
+    counts = np.bincount(codes[valid], minlength=len(uniques))
+
+    rates = []
+    for value in group_values:
+        matches = np.flatnonzero(uniques == value)
+        if len(matches) and counts[matches[0]] > 0:
+            rates.append(sums[matches[0]] / counts[matches[0]])
+        else:
+            rates.append(np.nan)
+    return rates
+
 
 def check_for_bias(
     df: pd.DataFrame,
@@ -92,11 +176,15 @@ def check_for_bias(
     try:
         # Basic statistical parity check
         if target_column and target_column in df.columns:
-            privileged_mask = df[protected_attribute] == privileged_groups[0][protected_attribute]
-            unprivileged_mask = df[protected_attribute] == unprivileged_groups[0][protected_attribute]
-
-            privileged_rate = df[privileged_mask][target_column].mean()
-            unprivileged_rate = df[unprivileged_mask][target_column].mean()
+            privileged_rate, unprivileged_rate = _group_rates(
+                df,
+                protected_attribute,
+                target_column,
+                [
+                    privileged_groups[0][protected_attribute],
+                    unprivileged_groups[0][protected_attribute]
+                ]
+            )
 
             statistical_parity_diff = abs(privileged_rate - unprivileged_rate)
             results['statistical_parity_difference'] = float(statistical_parity_diff)
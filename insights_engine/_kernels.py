@@ -0,0 +1,94 @@
+"""
+Compiled kernels for insight generation.
+
+The kernels are only defined when numba is installed; callers must check
+NUMBA_AVAILABLE before using them.
+"""
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.debug("numba not available. Fused insight kernel disabled.")
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True)
+    def fused_aggregates(ca, la, ag, g, dm, il):
+        """
+        Compute every insight aggregate in a single parallel pass over rows.
+
+        NaNs are skipped the same way the pandas/NumPy path skips them.
+
+        Args:
+            ca: credit_approved values.
+            la: loan_amount values.
+            ag: agriculture_output values.
+            g: gender values.
+            dm: decision_making values.
+            il: is_leader values.
+
+        Returns:
+            Tuple of (approved_count, approved_loan_sum, approved_loan_n,
+            agri_sum, agri_n, agri_max, women_count, women_dm_sum,
+            women_dm_n, women_leader_count).
+        """
+        n = ca.shape[0]
+        approved_count = 0
+        approved_loan_sum = 0.0
+        approved_loan_n = 0
+        agri_sum = 0.0
+        agri_n = 0
+        agri_max = -np.inf
+        women_count = 0
+        women_dm_sum = 0.0
+        women_dm_n = 0
+        women_leader_count = 0
+        for i in prange(n):
+            if ca[i] == 1:
+                approved_count += 1
+                loan = np.float64(la[i])
+                if not np.isnan(loan):
+                    approved_loan_sum += loan
+                    approved_loan_n += 1
+
+            output = np.float64(ag[i])
+            if not np.isnan(output):
+                agri_sum += output
+                agri_n += 1
+                agri_max = max(agri_max, output)
+
+            if g[i] == 0:
+                women_count += 1
+                score = np.float64(dm[i])
+                if not np.isnan(score):
+                    women_dm_sum += score
+                    women_dm_n += 1
+                if il[i] == 1:
+                    women_leader_count += 1
+
+        return (approved_count, approved_loan_sum, approved_loan_n,
+                agri_sum, agri_n, agri_max, women_count, women_dm_sum,
+                women_dm_n, women_leader_count)
+
+    @njit(cache=True, parallel=True)
+    def sum_squared_deviations(a, mean):
+        """
+        Sum of squared deviations from mean over the non-NaN values of a.
+
+        A second pass over one column keeps the variance numerically stable.
+        """
+        total = 0.0
+        for i in prange(a.shape[0]):
+            v = np.float64(a[i])
+            if not np.isnan(v):
+                d = v - mean
+                total += d * d
+        return total
@@ -6,14 +6,347 @@ credit access, food security, and women's agency metrics.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import weakref
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 
+from insights_engine._kernels import NUMBA_AVAILABLE
+from insights_engine.metrics import (
+    CreditMetrics,
+    FoodSecurityMetrics,
+    Insights,
+    WomenAgencyMetrics,
+)
+
+if NUMBA_AVAILABLE:
+    from insights_engine._kernels import fused_aggregates, sum_squared_deviations
+
 logger = logging.getLogger(__name__)
 
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    logger.debug("bottleneck not available. Falling back to NumPy for median/std.")
+    BOTTLENECK_AVAILABLE = False
+
+CREDIT_COLUMNS = ('credit_approved', 'loan_amount')
+AGRICULTURE_COLUMNS = ('agriculture_output',)
+WOMEN_AGENCY_COLUMNS = ('gender', 'decision_making', 'is_leader')
+INSIGHT_COLUMNS = CREDIT_COLUMNS + AGRICULTURE_COLUMNS + WOMEN_AGENCY_COLUMNS
+# Frames with fewer rows than this skip the fused numba kernel: its
+# per-process load (and per-dtype compile) cost outweighs the saving
+FUSED_ROW_THRESHOLD = 1_000_000
+
+# Value columns that are summed/averaged and must have a numeric dtype
+NUMERIC_COLUMNS = ('loan_amount', 'agriculture_output', 'decision_making')
+
+# Flat layout of the float64 buffer every insight computation writes into:
+# the metric fields of each domain's record, in declaration order
+_DOMAIN_RECORDS = {
+    'credit_access': CreditMetrics,
+    'food_security': FoodSecurityMetrics,
+    'women_agency': WomenAgencyMetrics,
+}
+_DOMAIN_METRICS = {
+    domain: tuple(field.name for field in fields(record_type) if field.name != 'error')
+    for domain, record_type in _DOMAIN_RECORDS.items()
+}
+INSIGHT_OFFSETS = {
+    metric: offset
+    for offset, metric in enumerate(
+        metric for metrics in _DOMAIN_METRICS.values() for metric in metrics
+    )
+}
+INSIGHT_SIZE = len(INSIGHT_OFFSETS)
+_DOMAIN_SLOTS = {
+    domain: slice(INSIGHT_OFFSETS[metrics[0]], INSIGHT_OFFSETS[metrics[-1]] + 1)
+    for domain, metrics in _DOMAIN_METRICS.items()
+}
+# Metrics stored as floats in the buffer but returned as int in records
+_COUNT_METRICS = frozenset(
+    field.name
+    for record_type in _DOMAIN_RECORDS.values()
+    for field in fields(record_type)
+    if field.type == Optional[int]
+)
+
+# Maximum number of results kept by generate_insights(enable_cache=True)
+INSIGHTS_CACHE_SIZE = 32
+# Rows sampled per column when fingerprinting a DataFrame for the cache
+CACHE_SAMPLE_ROWS = 64
+# Keyed on id(df); each entry holds a weak reference to the frame (so a
+# reused id can never hit), the frame's fingerprint and the result
+_insights_cache: "OrderedDict[int, Tuple[weakref.ref, Tuple[Hashable, ...], Insights]]" = OrderedDict()
+
+
+def clear_insights_cache() -> None:
+    """Drop all results cached by generate_insights(enable_cache=True)."""
+    _insights_cache.clear()
+
+
+def _cached_insights(df: pd.DataFrame, fingerprint: Tuple[Hashable, ...]) -> Optional[Insights]:
+    """Return the cached result for this very frame, if it is still current."""
+    entry = _insights_cache.get(id(df))
+    if entry is None:
+        return None
+    frame_ref, cached_fingerprint, insights = entry
+    if frame_ref() is not df or cached_fingerprint != fingerprint:
+        return None
+    _insights_cache.move_to_end(id(df))
+    return insights
+
+
+def _store_insights(
+    df: pd.DataFrame,
+    fingerprint: Tuple[Hashable, ...],
+    insights: Insights
+) -> None:
+    """Cache insights for df until it is garbage collected or evicted."""
+    key = id(df)
+
+    def evict(_: "weakref.ref[pd.DataFrame]") -> None:
+        # Drop the entry as soon as the frame dies so its id can be reused safely
+        _insights_cache.pop(key, None)
+
+    frame_ref = weakref.ref(df, evict)
+    _insights_cache[key] = (frame_ref, fingerprint, insights)
+    _insights_cache.move_to_end(key)
+    if len(_insights_cache) > INSIGHTS_CACHE_SIZE:
+        _insights_cache.popitem(last=False)
+
+
+def _check_is_frame(df: pd.DataFrame) -> None:
+    """Raise TypeError if df is not a DataFrame."""
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame")
+
+
+def _validate_frame(df: pd.DataFrame) -> None:
+    """Raise if df is not a non-empty DataFrame."""
+    _check_is_frame(df)
+
+    if df.empty:
+        logger.warning("Empty DataFrame provided for insights generation")
+        raise ValueError("Cannot generate insights from empty DataFrame")
+
+
+def _fingerprint(arrays: Dict[str, np.ndarray], nrows: int) -> Optional[Tuple[Hashable, ...]]:
+    """
+    Build a cheap fingerprint of the extracted insight columns.
+
+    Used only to notice edits to a frame that is already cached (the cache
+    itself is keyed on the frame's identity). The fingerprint combines the
+    row count, each column's dtype, the float64 sum of each numeric column
+    and a hash of a fixed strided sample of at most CACHE_SAMPLE_ROWS rows,
+    which costs far less than the insights themselves. In-place edits that
+    keep every sum and the sampled rows unchanged are not detected; call
+    clear_insights_cache() after such edits.
+
+    Returns:
+        The fingerprint, or None if the columns hold unhashable values.
+    """
+    step = max(1, nrows // CACHE_SAMPLE_ROWS)
+    parts: List[Hashable] = [nrows]
+    for name, arr in arrays.items():
+        try:
+            sample_hash = pd.util.hash_array(arr[::step]).tobytes()
+        except TypeError:
+            return None
+        checksum = arr.sum(dtype=np.float64).tobytes() if arr.dtype.kind in 'biuf' else b''
+        parts.append((name, arr.dtype.str, checksum, sample_hash))
+    return tuple(parts)
+
+
+def _extract(
+    df: pd.DataFrame,
+    names: Iterable[str],
+    columns: Optional[FrozenSet[Hashable]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Pull the requested columns out of a DataFrame as NumPy arrays.
+
+    The column index is scanned once and each present column is converted a
+    single time, so the metric helpers never touch the DataFrame again.
+    Nullable numeric extension columns are returned as float64 with NaN for
+    missing values.
+
+    Args:
+        df: Input DataFrame.
+        names: Column names to extract. Missing columns are skipped.
+        columns: frozenset(df.columns) if the caller already has it.
+
+    Returns:
+        Dictionary mapping each present column name to its values.
+
+    Raises:
+        TypeError: If one of NUMERIC_COLUMNS is present with a non-numeric dtype.
+    """
+    if columns is None:
+        columns = frozenset(df.columns)
+    arrays = {}
+    for name in names:
+        if name not in columns:
+            continue
+        if name in NUMERIC_COLUMNS:
+            _require_numeric(df, name)
+        arrays[name] = _col(df, name)
+    return arrays
+
+
+def _require_numeric(df: pd.DataFrame, name: str) -> None:
+    """
+    Raise TypeError unless column name has a numeric dtype.
+
+    Object/string columns are rejected up front rather than converted
+    implicitly inside every reduction; use pd.to_numeric (or
+    preprocess_data's numeric_columns) to coerce them first.
+    """
+    dtype = df[name].dtype
+    if not pd.api.types.is_numeric_dtype(dtype):
+        raise TypeError(f"Column '{name}' must be numeric, got dtype {dtype}")
+
 
-def generate_insights(df: pd.DataFrame) -> Dict[str, Any]:
+def _col(df: pd.DataFrame, name: str) -> np.ndarray:
+    """
+    Return a column's values as a NumPy array, without copying where possible.
+
+    NumPy-backed columns come back as a view of the DataFrame's data; a copy
+    is only made when a nullable extension column has to be converted to
+    float64/NaN.
+
+    Args:
+        df: Input DataFrame.
+        name: Column name.
+
+    Returns:
+        The column values. Treat the array as read-only: it may share memory
+        with df.
+    """
+    series = df[name]
+    if not isinstance(series.dtype, np.dtype) and pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return series.to_numpy(copy=False)
+
+
+def _mean(arr: np.ndarray) -> float:
+    """
+    Mean of a non-empty numeric array, skipping NaNs.
+
+    Integer arrays and float arrays without NaNs are reduced with a plain
+    float64 sum; only float arrays that actually contain NaNs go through
+    ``np.nanmean``.
+    """
+    if arr.dtype.kind == 'f' and np.isnan(arr).any():
+        return float(np.nanmean(arr, dtype=np.float64))
+    return float(arr.sum(dtype=np.float64) / arr.size)
+
+
+def _median(arr: np.ndarray) -> float:
+    """Median of a non-empty, NaN-free numeric array."""
+    if BOTTLENECK_AVAILABLE:
+        # Partial sort in C; avoids NumPy's full partition copy machinery
+        return float(bn.nanmedian(arr))
+    return float(np.median(arr))
+
+
+def _std(arr: np.ndarray) -> float:
+    """Sample standard deviation (ddof=1) of a NaN-free numeric array."""
+    if BOTTLENECK_AVAILABLE and arr.dtype != np.float32:
+        # bottleneck accumulates float32 input in float32, so narrow
+        # floats stay on the NumPy path with a float64 accumulator
+        return float(bn.nanstd(arr, ddof=1))
+    return float(arr.std(ddof=1, dtype=np.float64))
+
+
+def _can_fuse(arrays: Dict[str, np.ndarray], nrows: int) -> bool:
+    """Whether the fused numba kernel should compute all insights at once."""
+    return (
+        NUMBA_AVAILABLE
+        and nrows >= FUSED_ROW_THRESHOLD
+        and len(arrays) == len(INSIGHT_COLUMNS)
+        and all(arr.dtype.kind in 'biuf' for arr in arrays.values())
+    )
+
+
+def _fused_insights_into(arrays: Dict[str, np.ndarray], nrows: int, out: np.ndarray) -> None:
+    """
+    Compute all three insight domains with the fused numba kernel into out.
+
+    Every count, sum and max comes from one parallel pass over the rows; only
+    the output std (a second pass over one column, for numerical stability)
+    and the median need further work.
+    """
+    (approved_count, approved_loan_sum, approved_loan_n,
+     agri_sum, agri_n, agri_max, women_count, women_dm_sum,
+     women_dm_n, women_leader_count) = fused_aggregates(
+        *(arrays[name] for name in INSIGHT_COLUMNS)
+    )
+
+    if approved_count == 0:
+        average_loan = 0.0
+    else:
+        average_loan = approved_loan_sum / approved_loan_n if approved_loan_n else np.nan
+
+    output = arrays['agriculture_output']
+    if agri_n < nrows:
+        output = output[~np.isnan(output)]
+    if agri_n > 0:
+        median_output = _median(output)
+        max_output = agri_max
+    else:
+        median_output = max_output = np.nan
+    if agri_n > 1:
+        sq_dev = sum_squared_deviations(output, agri_sum / agri_n)
+        std_output = np.sqrt(sq_dev / (agri_n - 1))
+    else:
+        std_output = np.nan
+
+    if women_count > 0:
+        decision_making_score = women_dm_sum / women_dm_n if women_dm_n else np.nan
+        leader_count = women_leader_count
+    else:
+        decision_making_score = leader_count = np.nan
+
+    _write_credit_metrics(out, nrows, approved_count, average_loan)
+    _write_agriculture_metrics(out, nrows, agri_n, agri_sum, median_output, std_output, max_output)
+    _write_women_metrics(out, nrows, women_count, decision_making_score, leader_count)
+
+
+def _insights_into(arrays: Dict[str, np.ndarray], nrows: int, out: np.ndarray) -> None:
+    """Write every insight metric for pre-extracted arrays into out."""
+    if _can_fuse(arrays, nrows):
+        _fused_insights_into(arrays, nrows, out)
+    else:
+        _credit_access_into(arrays, nrows, out)
+        _agriculture_into(arrays, nrows, out)
+        _women_inclusion_into(arrays, nrows, out)
+
+
+def _record_from_buffer(domain: str, out: np.ndarray, unset: Iterable[str] = ()) -> Any:
+    """Build a domain's metrics record from its slots in out."""
+    metrics = {}
+    for name in _DOMAIN_METRICS[domain]:
+        if name in unset:
+            continue
+        value = out[INSIGHT_OFFSETS[name]]
+        metrics[name] = int(value) if name in _COUNT_METRICS else float(value)
+    return _DOMAIN_RECORDS[domain](**metrics)
+
+
+def _insights_record(arrays: Dict[str, np.ndarray], out: np.ndarray) -> Insights:
+    """Package the metrics in out as an Insights record."""
+    return Insights(
+        credit_access=_credit_record(arrays, out),
+        food_security=_agriculture_record(arrays, out),
+        women_agency=_women_record(arrays, out)
+    )
+
+
+def generate_insights(df: pd.DataFrame, enable_cache: bool = False) -> Insights:
     """
     Generate comprehensive insights from processed DataFrame.
 
@@ -22,17 +355,30 @@ def generate_insights(df: pd.DataFrame) -> Dict[str, Any]:
     - Food security indicators
     - Women's agency and inclusion metrics
 
+    Narrow column dtypes (e.g. int8 indicators and float32 values from
+    ``preprocess_data(downcast=True)``) are read as-is without widening
+    copies; all sums and means are still accumulated in float64.
+
     Args:
         df: Input DataFrame containing processed data.
+        enable_cache: If True, returns the cached result when this same
+                     DataFrame object was already analyzed. Different frames
+                     never share an entry. Edits to a cached frame are
+                     detected with a cheap fingerprint (dtypes, column sums
+                     and sampled rows); call clear_insights_cache() after
+                     in-place edits it might miss, and to free memory.
 
     Returns:
-        Dictionary containing insights for each domain with the following keys:
+        Insights record with the following fields (also readable by key,
+        e.g. ``insights['credit_access']``; use ``to_dict()`` for JSON):
         - credit_access: Credit access metrics
         - food_security: Food security analysis
         - women_agency: Women's inclusion metrics
 
     Raises:
-        ValueError: If DataFrame is empty or invalid.
+        ValueError: If DataFrame is empty.
+        TypeError: If input is not a DataFrame, or a value column
+                   (NUMERIC_COLUMNS) is not numeric.
 
     Example:
         >>> df = pd.DataFrame({
@@ -41,23 +387,192 @@ def generate_insights(df: pd.DataFrame) -> Dict[str, Any]:
         ... })
         >>> insights = generate_insights(df)
     """
-    if df.empty:
-        logger.warning("Empty DataFrame provided for insights generation")
-        raise ValueError("Cannot generate insights from empty DataFrame")
-
-    if not isinstance(df, pd.DataFrame):
-        raise TypeError("Input must be a pandas DataFrame")
+    # Validate once here; the private helpers below trust their input
+    _validate_frame(df)
+    columns = frozenset(df.columns)
+
+    nrows = len(df)
+    arrays = _extract(df, INSIGHT_COLUMNS, columns)
+
+    fingerprint = _fingerprint(arrays, nrows) if enable_cache else None
+    if fingerprint is not None:
+        cached = _cached_insights(df, fingerprint)
+        if cached is not None:
+            logger.info("Returning cached insights")
+            return cached
+
+    logger.info(f"Generating insights from DataFrame with {nrows} rows")
+    out = np.empty(INSIGHT_SIZE)
+    _insights_into(arrays, nrows, out)
+    insights = _insights_record(arrays, out)
+    if fingerprint is not None:
+        # Records are immutable, so the cached object can be shared
+        _store_insights(df, fingerprint, insights)
 
-    logger.info(f"Generating insights from DataFrame with {len(df)} rows")
-    insights = {
-        'credit_access': calculate_credit_access_metrics(df),
-        'food_security': analyze_agriculture_output(df),
-        'women_agency': assess_women_inclusion(df)
-    }
     logger.info("Insights generation completed successfully")
     return insights
 
-def calculate_credit_access_metrics(df: pd.DataFrame) -> Dict[str, Any]:
+def generate_insights_into(df: pd.DataFrame, out: np.ndarray) -> np.ndarray:
+    """
+    Generate insights straight into a caller-supplied float64 buffer.
+
+    Intended for streaming use, where insights are generated for many chunks
+    of a larger dataset: the aggregates are written directly into out (or one
+    row of a 2-D array per chunk), without building the metric records that
+    generate_insights returns. Metric positions are given by INSIGHT_OFFSETS;
+    metrics that could not be computed (missing columns, or no women for the
+    optional women's agency metrics) are written as NaN.
+
+    Args:
+        df: Input DataFrame containing processed data.
+        out: Writable 1-D float64 array of length INSIGHT_SIZE.
+
+    Returns:
+        The out array.
+
+    Raises:
+        ValueError: If DataFrame is empty or out has the wrong shape or dtype.
+        TypeError: If input is not a DataFrame, or a value column
+                   (NUMERIC_COLUMNS) is not numeric.
+
+    Example:
+        >>> out = np.empty(INSIGHT_SIZE)
+        >>> generate_insights_into(df, out)
+        >>> out[INSIGHT_OFFSETS['credit_approval_rate']]
+    """
+    if not isinstance(out, np.ndarray) or out.dtype != np.float64 or out.shape != (INSIGHT_SIZE,):
+        raise ValueError(f"out must be a float64 array of shape ({INSIGHT_SIZE},)")
+
+    _validate_frame(df)
+    _insights_into(_extract(df, INSIGHT_COLUMNS), len(df), out)
+    return out
+
+def generate_insights_by_group(
+    df: pd.DataFrame,
+    by: Union[str, List[str]]
+) -> pd.DataFrame:
+    """
+    Generate insights for every group (e.g. country, region, year) at once.
+
+    All metrics are computed with a single vectorized groupby aggregation
+    instead of calling generate_insights once per group in Python. Domains
+    whose source columns are missing are left out.
+
+    Args:
+        df: Input DataFrame containing processed data.
+        by: Column name or list of column names to group by.
+
+    Returns:
+        DataFrame indexed by group, with one column per metric. Column names
+        match the metric names returned by generate_insights, and metrics it
+        leaves unset (e.g. leadership metrics for groups without women) are
+        NaN.
+
+    Raises:
+        ValueError: If DataFrame is empty or a grouping column is missing.
+        TypeError: If input is not a DataFrame, or a value column
+                   (NUMERIC_COLUMNS) is not numeric.
+
+    Example:
+        >>> df = pd.DataFrame({
+        ...     'region': ['a', 'a', 'b'],
+        ...     'credit_approved': [1, 0, 1],
+        ...     'loan_amount': [1000, 0, 2000]
+        ... })
+        >>> by_region = generate_insights_by_group(df, 'region')
+    """
+    _validate_frame(df)
+
+    keys = [by] if isinstance(by, str) else list(by)
+    missing_keys = pd.Index(keys).difference(df.columns)
+    if len(missing_keys):
+        raise ValueError(f"Missing group columns: {', '.join(missing_keys)}")
+
+    # Precompute per-row indicator and masked value columns so that every
+    # metric reduces to a built-in (Cython) groupby aggregation
+    columns = frozenset(df.columns)
+    for name in NUMERIC_COLUMNS:
+        if name in columns:
+            _require_numeric(df, name)
+    work = {key: df[key] for key in keys}
+    aggregations = {'n': (keys[0], 'size')}
+
+    has_credit = {'credit_approved', 'loan_amount'} <= columns
+    if has_credit:
+        approved = df['credit_approved'] == 1
+        work['approved'] = approved
+        work['approved_loan'] = df['loan_amount'].where(approved)
+        aggregations['total_approved'] = ('approved', 'sum')
+        aggregations['average_loan_amount'] = ('approved_loan', 'mean')
+
+    has_agriculture = 'agriculture_output' in columns
+    if has_agriculture:
+        work['agriculture_output'] = df['agriculture_output']
+        aggregations['total_agriculture_output'] = ('agriculture_output', 'sum')
+        aggregations['average_output_per_household'] = ('agriculture_output', 'mean')
+        aggregations['median_output_per_household'] = ('agriculture_output', 'median')
+        aggregations['output_std'] = ('agriculture_output', 'std')
+        aggregations['max_output'] = ('agriculture_output', 'max')
+
+    has_gender = 'gender' in columns
+    if has_gender:
+        women = df['gender'] == 0
+        work['women'] = women
+        aggregations['total_women'] = ('women', 'sum')
+        if 'decision_making' in columns:
+            work['women_decision_making'] = df['decision_making'].where(women)
+            aggregations['women_decision_making_score'] = ('women_decision_making', 'mean')
+        if 'is_leader' in columns:
+            work['women_leader'] = women & (df['is_leader'] == 1)
+            aggregations['women_leaders_count'] = ('women_leader', 'sum')
+
+    grouped = pd.DataFrame(work).groupby(keys, sort=False, observed=True)
+    agg = grouped.agg(**aggregations)
+    n = agg.pop('n')
+
+    result = pd.DataFrame(index=agg.index)
+    if has_credit:
+        result['credit_approval_rate'] = agg['total_approved'] / n
+        result['average_loan_amount'] = agg['average_loan_amount'].where(
+            agg['total_approved'] > 0, 0.0
+        )
+        result['total_applications'] = n
+        result['total_approved'] = agg['total_approved']
+        result['total_rejected'] = n - agg['total_approved']
+        result['rejection_rate'] = result['total_rejected'] / n
+
+    if has_agriculture:
+        for name in ('total_agriculture_output', 'average_output_per_household',
+                     'median_output_per_household', 'output_std'):
+            result[name] = agg[name]
+        max_output = agg['max_output']
+        result['food_security_score'] = (
+            (agg['average_output_per_household'] / max_output).where(max_output > 0, 0.0)
+        )
+        result['household_count'] = n
+
+    if has_gender:
+        participation = agg['total_women'] / n
+        result['women_participation_rate'] = participation
+        result['total_women'] = agg['total_women']
+        result['total_men'] = n - agg['total_women']
+        result['total_participants'] = n
+        result['gender_balance_score'] = np.minimum(2.0 * participation, 2.0 * (1.0 - participation))
+        # Like generate_insights, the optional metrics are unset (NaN) for
+        # groups without women
+        has_women = agg['total_women'] > 0
+        if 'women_decision_making_score' in agg:
+            result['women_decision_making_score'] = agg['women_decision_making_score'].where(has_women)
+        if 'women_leaders_count' in agg:
+            result['women_leadership_rate'] = (
+                agg['women_leaders_count'] / agg['total_women']
+            ).where(has_women)
+            result['women_leaders_count'] = agg['women_leaders_count'].where(has_women)
+
+    logger.info(f"Generated insights for {len(result)} groups")
+    return result
+
+def calculate_credit_access_metrics(df: pd.DataFrame) -> CreditMetrics:
     """
     Calculate credit access metrics from the dataset.
 
@@ -70,13 +585,16 @@ def calculate_credit_access_metrics(df: pd.DataFrame) -> Dict[str, Any]:
             - loan_amount: Amount of loan requested/approved
 
     Returns:
-        Dictionary containing credit access metrics:
+        CreditMetrics record containing credit access metrics:
         - credit_approval_rate: Percentage of approved applications
         - average_loan_amount: Mean loan amount for approved applications
         - total_applications: Total number of credit applications
         - total_approved: Number of approved applications
         - rejection_rate: Percentage of rejected applications
 
+    Raises:
+        TypeError: If input is not a DataFrame or a value column is not numeric.
+
     Example:
         >>> df = pd.DataFrame({
         ...     'credit_approved': [1, 0, 1, 1],
@@ -84,35 +602,66 @@ def calculate_credit_access_metrics(df: pd.DataFrame) -> Dict[str, Any]:
         ... })
         >>> metrics = calculate_credit_access_metrics(df)
     """
-    if 'credit_approved' not in df.columns:
-        logger.warning("'credit_approved' column not found")
-        return {'error': 'credit_approved column not found'}
-
-    if 'loan_amount' not in df.columns:
-        logger.warning("'loan_amount' column not found")
-        return {'error': 'loan_amount column not found'}
-
-    total_applications = len(df)
-    approved_mask = df['credit_approved'] == 1
-    approved_count = approved_mask.sum()
-    rejected_count = total_applications - approved_count
+    _check_is_frame(df)
+    arrays = _extract(df, CREDIT_COLUMNS)
+    out = np.empty(INSIGHT_SIZE)
+    _credit_access_into(arrays, len(df), out)
+    return _credit_record(arrays, out)
 
-    approved_loans = df[approved_mask]['loan_amount']
-    average_loan = float(approved_loans.mean()) if approved_count > 0 else 0.0
-
-    metrics = {
-        'credit_approval_rate': float(approved_count / total_applications) if total_applications > 0 else 0.0,
-        'average_loan_amount': average_loan,
-        'total_applications': int(total_applications),
-        'total_approved': int(approved_count),
-        'total_rejected': int(rejected_count),
-        'rejection_rate': float(rejected_count / total_applications) if total_applications > 0 else 0.0
-    }
+def _credit_access_into(arrays: Dict[str, np.ndarray], nrows: int, out: np.ndarray) -> None:
+    """
+    Write credit access metrics for pre-extracted column arrays into out.
 
-    logger.info(f"Credit access metrics calculated: {approved_count}/{total_applications} approved")
+    Assumes validated input (see generate_insights); if a required column
+    is missing, the credit slots are set to NaN.
+    """
+    for name in CREDIT_COLUMNS:
+        if name not in arrays:
+            logger.warning(f"'{name}' column not found")
+            out[_DOMAIN_SLOTS['credit_access']] = np.nan
+            return
+
+    # Work on the raw arrays: one mask, no row-filtered DataFrame copy
+    approved_mask = arrays['credit_approved'] == 1
+    approved_count = int(np.count_nonzero(approved_mask))
+
+    approved_loans = arrays['loan_amount'][approved_mask]
+    average_loan = (
+        _mean(approved_loans)
+        if approved_count > 0 else 0.0
+    )
+    _write_credit_metrics(out, nrows, approved_count, average_loan)
+
+def _write_credit_metrics(
+    out: np.ndarray,
+    total_applications: int,
+    approved_count: int,
+    average_loan: float
+) -> None:
+    """Write the credit access metrics derived from raw aggregates into out."""
+    n = total_applications
+    rejected_count = n - approved_count
+    out[INSIGHT_OFFSETS['credit_approval_rate']] = approved_count / n if n else 0.0
+    out[INSIGHT_OFFSETS['average_loan_amount']] = average_loan
+    out[INSIGHT_OFFSETS['total_applications']] = n
+    out[INSIGHT_OFFSETS['total_approved']] = approved_count
+    out[INSIGHT_OFFSETS['total_rejected']] = rejected_count
+    out[INSIGHT_OFFSETS['rejection_rate']] = rejected_count / n if n else 0.0
+
+def _credit_record(arrays: Dict[str, np.ndarray], out: np.ndarray) -> CreditMetrics:
+    """Assemble the credit access metrics record from out."""
+    for name in CREDIT_COLUMNS:
+        if name not in arrays:
+            return CreditMetrics(error=f'{name} column not found')
+
+    metrics = _record_from_buffer('credit_access', out)
+    logger.info(
+        f"Credit access metrics calculated: "
+        f"{metrics.total_approved}/{metrics.total_applications} approved"
+    )
     return metrics
 
-def analyze_agriculture_output(df: pd.DataFrame) -> Dict[str, Any]:
+def analyze_agriculture_output(df: pd.DataFrame) -> FoodSecurityMetrics:
     """
     Analyze agriculture output and food security metrics.
 
@@ -124,47 +673,88 @@ def analyze_agriculture_output(df: pd.DataFrame) -> Dict[str, Any]:
             - agriculture_output: Agricultural output values
 
     Returns:
-        Dictionary containing food security metrics:
+        FoodSecurityMetrics record containing food security metrics:
         - total_agriculture_output: Sum of all agriculture output
         - average_output_per_household: Mean agriculture output
         - food_security_score: Normalized food security score (0-1)
         - median_output: Median agriculture output
         - output_std: Standard deviation of output
 
+    Raises:
+        TypeError: If input is not a DataFrame or a value column is not numeric.
+
     Example:
         >>> df = pd.DataFrame({'agriculture_output': [100, 200, 150, 180]})
         >>> metrics = analyze_agriculture_output(df)
     """
-    if 'agriculture_output' not in df.columns:
+    _check_is_frame(df)
+    arrays = _extract(df, AGRICULTURE_COLUMNS)
+    out = np.empty(INSIGHT_SIZE)
+    _agriculture_into(arrays, len(df), out)
+    return _agriculture_record(arrays, out)
+
+def _agriculture_into(arrays: Dict[str, np.ndarray], nrows: int, out: np.ndarray) -> None:
+    """
+    Write food security metrics for pre-extracted column arrays into out.
+
+    Assumes validated input (see generate_insights); if the output column
+    is missing, the food security slots are set to NaN.
+    """
+    if 'agriculture_output' not in arrays:
         logger.warning("'agriculture_output' column not found")
-        return {'error': 'agriculture_output column not found'}
+        out[_DOMAIN_SLOTS['food_security']] = np.nan
+        return
+
+    # Materialize the column once and compute every statistic on the array
+    output = arrays['agriculture_output']
+    nan_mask = np.isnan(output)
+    if nan_mask.any():
+        output = output[~nan_mask]
+
+    n = output.size
+    total_output = output.sum(dtype=np.float64)
+    median_output = _median(output) if n > 0 else np.nan
+    max_output = output.max() if n > 0 else np.nan
+    std_output = _std(output) if n > 1 else np.nan
+    _write_agriculture_metrics(
+        out, nrows, n, total_output, median_output, std_output, max_output
+    )
 
-    output_col = df['agriculture_output']
-    total_output = float(output_col.sum())
-    mean_output = float(output_col.mean())
-    median_output = float(output_col.median())
-    std_output = float(output_col.std())
-    max_output = float(output_col.max())
+def _write_agriculture_metrics(
+    out: np.ndarray,
+    nrows: int,
+    n: int,
+    total_output: float,
+    median_output: float,
+    std_output: float,
+    max_output: float
+) -> None:
+    """Write the food security metrics derived from raw aggregates into out."""
+    mean_output = total_output / n if n else np.nan
 
     # Calculate normalized food security score
     food_security_score = (
         mean_output / max_output if max_output > 0 else 0.0
     )
 
-    metrics = {
-        'total_agriculture_output': total_output,
-        'average_output_per_household': mean_output,
-        'median_output_per_household': median_output,
-        'output_std': std_output,
-        'food_security_score': food_security_score,
-        'household_count': int(len(df))
-    }
+    out[INSIGHT_OFFSETS['total_agriculture_output']] = total_output
+    out[INSIGHT_OFFSETS['average_output_per_household']] = mean_output
+    out[INSIGHT_OFFSETS['median_output_per_household']] = median_output
+    out[INSIGHT_OFFSETS['output_std']] = std_output
+    out[INSIGHT_OFFSETS['food_security_score']] = food_security_score
+    out[INSIGHT_OFFSETS['household_count']] = nrows
+
+def _agriculture_record(arrays: Dict[str, np.ndarray], out: np.ndarray) -> FoodSecurityMetrics:
+    """Assemble the food security metrics record from out."""
+    if 'agriculture_output' not in arrays:
+        return FoodSecurityMetrics(error='agriculture_output column not found')
 
-    logger.info(f"Agriculture analysis completed: {len(df)} households analyzed")
+    metrics = _record_from_buffer('food_security', out)
+    logger.info(f"Agriculture analysis completed: {metrics.household_count} households analyzed")
     return metrics
 
 
-def assess_women_inclusion(df: pd.DataFrame) -> Dict[str, Any]:
+def assess_women_inclusion(df: pd.DataFrame) -> WomenAgencyMetrics:
     """
     Assess women's inclusion and agency metrics in the dataset.
 
@@ -178,13 +768,16 @@ def assess_women_inclusion(df: pd.DataFrame) -> Dict[str, Any]:
             - is_leader: Optional leadership indicator
 
     Returns:
-        Dictionary containing women's agency metrics:
+        WomenAgencyMetrics record containing women's agency metrics:
         - women_participation_rate: Proportion of women in dataset
         - women_decision_making_score: Average decision-making score for women
         - women_leadership_rate: Proportion of women in leadership roles
         - total_women: Total number of women in dataset
         - total_participants: Total number of participants
 
+    Raises:
+        TypeError: If input is not a DataFrame or a value column is not numeric.
+
     Example:
         >>> df = pd.DataFrame({
         ...     'gender': [0, 0, 1, 1],
@@ -193,46 +786,95 @@ def assess_women_inclusion(df: pd.DataFrame) -> Dict[str, Any]:
         ... })
         >>> metrics = assess_women_inclusion(df)
     """
-    if 'gender' not in df.columns:
-        logger.warning("'gender' column not found")
-        return {'error': 'gender column not found'}
+    _check_is_frame(df)
+    arrays = _extract(df, WOMEN_AGENCY_COLUMNS)
+    out = np.empty(INSIGHT_SIZE)
+    _women_inclusion_into(arrays, len(df), out)
+    return _women_record(arrays, out)
+
 
-    total_participants = len(df)
-    women_mask = df['gender'] == 0
-    women_data = df[women_mask]
-    women_count = women_mask.sum()
-    men_count = total_participants - women_count
+def _women_inclusion_into(arrays: Dict[str, np.ndarray], nrows: int, out: np.ndarray) -> None:
+    """
+    Write women's agency metrics for pre-extracted column arrays into out.
+
+    Assumes validated input (see generate_insights); if the gender column
+    is missing, the women's agency slots are set to NaN.
+    """
+    if 'gender' not in arrays:
+        logger.warning("'gender' column not found")
+        out[_DOMAIN_SLOTS['women_agency']] = np.nan
+        return
+
+    # Index only the columns that are needed; never copy the women's rows
+    women_mask = arrays['gender'] == 0
+    women_count = int(np.count_nonzero(women_mask))
+
+    # Scalar test on the count already computed; the optional metrics are
+    # skipped entirely for groups without women
+    decision_making_score = np.nan
+    leader_count = np.nan
+    if women_count > 0:
+        if 'decision_making' in arrays:
+            decision_making = arrays['decision_making'][women_mask]
+            decision_making_score = _mean(decision_making)
+
+        if 'is_leader' in arrays:
+            leader_count = float(np.count_nonzero(arrays['is_leader'][women_mask] == 1))
+
+    _write_women_metrics(out, nrows, women_count, decision_making_score, leader_count)
+
+
+def _write_women_metrics(
+    out: np.ndarray,
+    total_participants: int,
+    women_count: int,
+    decision_making_score: float,
+    leader_count: float
+) -> None:
+    """
+    Write the women's agency metrics derived from raw aggregates into out.
 
-    women_participation_rate = (
-        float(women_count / total_participants) if total_participants > 0 else 0.0
+    decision_making_score and leader_count are NaN when the corresponding
+    column is absent (or there are no women); their metrics are then NaN.
+    """
+    n = total_participants
+    women_participation_rate = women_count / n if n else 0.0
+
+    out[INSIGHT_OFFSETS['women_participation_rate']] = women_participation_rate
+    out[INSIGHT_OFFSETS['total_women']] = women_count
+    out[INSIGHT_OFFSETS['total_men']] = n - women_count
+    out[INSIGHT_OFFSETS['total_participants']] = n
+    # Score closer to 1 = more balanced; equals 1 - 2 * |r - 0.5|
+    out[INSIGHT_OFFSETS['gender_balance_score']] = min(
+        2.0 * women_participation_rate, 2.0 * (1.0 - women_participation_rate)
     )
+    out[INSIGHT_OFFSETS['women_decision_making_score']] = decision_making_score
+    out[INSIGHT_OFFSETS['women_leadership_rate']] = (
+        leader_count / women_count if women_count else np.nan
+    )
+    out[INSIGHT_OFFSETS['women_leaders_count']] = leader_count
+
+
+def _women_record(arrays: Dict[str, np.ndarray], out: np.ndarray) -> WomenAgencyMetrics:
+    """
+    Assemble the women's agency metrics record from out.
+
+    The decision-making and leadership metrics are left unset (None) when
+    their columns are absent or there are no women.
+    """
+    if 'gender' not in arrays:
+        return WomenAgencyMetrics(error='gender column not found')
 
-    metrics = {
-        'women_participation_rate': women_participation_rate,
-        'total_women': int(women_count),
-        'total_men': int(men_count),
-        'total_participants': int(total_participants),
-        'gender_balance_score': (
-            1.0 - abs(women_participation_rate - 0.5) * 2
-        )  # Score closer to 1 = more balanced
-    }
-
-    # Add optional metrics if columns exist
-    if not women_data.empty:
-        if 'decision_making' in women_data.columns:
-            metrics['women_decision_making_score'] = float(
-                women_data['decision_making'].mean()
-            )
-
-        if 'is_leader' in women_data.columns:
-            leader_count = (women_data['is_leader'] == 1).sum()
-            metrics['women_leadership_rate'] = (
-                float(leader_count / women_count) if women_count > 0 else 0.0
-            )
-            metrics['women_leaders_count'] = int(leader_count)
+    unset = set()
+    has_women = out[INSIGHT_OFFSETS['total_women']] > 0
+    if not (has_women and 'decision_making' in arrays):
+        unset.add('women_decision_making_score')
+    if not (has_women and 'is_leader' in arrays):
+        unset.update(('women_leadership_rate', 'women_leaders_count'))
 
+    metrics = _record_from_buffer('women_agency', out, unset)
     logger.info(
-        f"Women inclusion assessment: {women_count}/{total_participants} women "
-        f"({women_participation_rate:.1%})"
+        f"Women inclusion assessment: {metrics.total_women}/{metrics.total_participants} women "
+        f"({metrics.women_participation_rate:.1%})"
     )
     return metrics
@@ -0,0 +1,120 @@
+"""
+Result records returned by the insights engine.
+
+Metrics are immutable, slotted dataclasses rather than nested dictionaries,
+which keeps per-call allocations small when insights are generated in tight
+loops. For compatibility they also support read-only mapping access
+(``metrics['credit_approval_rate']``, ``'error' in metrics``), and
+``to_dict()`` returns plain dictionaries for JSON serialization.
+"""
+
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict, Iterator, List, Optional
+
+# slots=True is only available on Python 3.10+
+_DATACLASS_OPTIONS = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS['slots'] = True
+
+
+class _MetricsRecord:
+    """
+    Read-only mapping interface over a metrics dataclass.
+
+    Fields set to None (metrics that were not computed) are treated as
+    absent keys, mirroring the dictionaries previously returned.
+    """
+
+    __slots__ = ()
+    # Provided by @dataclass on the concrete records; declared for type checkers
+    __dataclass_fields__: ClassVar[Dict[str, Any]]
+
+    def keys(self) -> List[str]:
+        """Names of the metrics that were computed."""
+        return [f.name for f in fields(self) if getattr(self, f.name) is not None]
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None) if isinstance(key, str) else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the metric value for key, or default if it is absent."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and getattr(self, key, None) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the computed metrics as a plain dictionary."""
+        return {key: _to_plain(getattr(self, key)) for key in self.keys()}
+
+
+def _to_plain(value: Any) -> Any:
+    return value.to_dict() if isinstance(value, _MetricsRecord) else value
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class CreditMetrics(_MetricsRecord):
+    """Credit access metrics. Only error is set if required columns are missing."""
+
+    credit_approval_rate: Optional[float] = None
+    average_loan_amount: Optional[float] = None
+    total_applications: Optional[int] = None
+    total_approved: Optional[int] = None
+    total_rejected: Optional[int] = None
+    rejection_rate: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class FoodSecurityMetrics(_MetricsRecord):
+    """Food security metrics. Only error is set if required columns are missing."""
+
+    total_agriculture_output: Optional[float] = None
+    average_output_per_household: Optional[float] = None
+    median_output_per_household: Optional[float] = None
+    output_std: Optional[float] = None
+    food_security_score: Optional[float] = None
+    household_count: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class WomenAgencyMetrics(_MetricsRecord):
+    """
+    Women's agency metrics. Only error is set if required columns are missing.
+
+    The decision-making and leadership metrics are None when their source
+    columns are absent or the dataset contains no women.
+    """
+
+    women_participation_rate: Optional[float] = None
+    total_women: Optional[int] = None
+    total_men: Optional[int] = None
+    total_participants: Optional[int] = None
+    gender_balance_score: Optional[float] = None
+    women_decision_making_score: Optional[float] = None
+    women_leadership_rate: Optional[float] = None
+    women_leaders_count: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Insights(_MetricsRecord):
+    """Insights across all three domains, as returned by generate_insights."""
+
+    credit_access: CreditMetrics
+    food_security: FoodSecurityMetrics
+    women_agency: WomenAgencyMetrics
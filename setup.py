@@ -34,6 +34,14 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "performance": [
+            "bottleneck>=1.3.0",
+            "connectorx>=0.3.0",
+            "numba>=0.57.0",
+            "orjson>=3.8.0",
+            "polars>=0.20.0",
+            "pyarrow>=10.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",